@@ -0,0 +1,11 @@
+# Augmenting declarations for main.py, only used when it is compiled with Cython (see setup.py).
+# They give the hot per-example functions C-typed locals without changing main.py itself.
+import cython
+
+cpdef _write_lines(list lines, int level=*)
+
+@cython.locals(data=object, errors=list)
+cpdef tuple _validate_one(object example_document)
+
+@cython.locals(example_file=str, ok=bint, message=str, lines=list)
+cpdef _report_examples(list example_files, object example_results)
@@ -1,299 +1,350 @@
+import argparse
+import hashlib
+import json
+import logging
 import os
+import pickle
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
+import pydantic
+import pydantic_core
 from pydantic import ValidationError
+from pydantic_core import ErrorDetails
 
-from models.arazzo import validate_arazzo_data, load_and_validate_arazzo_yaml
+import models.arazzo
+from models.arazzo import (
+    ArazzoSpecification, construct_model, validate_arazzo_data_safe, validate_arazzo_json, load_arazzo_yaml
+)
+
+try:
+    from models.arazzo_msgspec import decode_arazzo_json
+except ImportError:
+    # msgspec is optional; without it the FAST path falls back to Pydantic
+    decode_arazzo_json = None
+
+log = logging.getLogger(__name__)
+
+# Report output goes to stdout through this module's own handler; the root logger is left to the host application
+_LOG_HANDLER = logging.StreamHandler()
+_LOG_HANDLER.setFormatter(logging.Formatter("%(message)s"))
 
 SCRIPT_DIR = os.path.dirname(os.path.realpath(__file__))
 
 EXAMPLE_FILES_DIR = os.path.join(SCRIPT_DIR, "examples")
 
-if __name__ == "__main__":
+EXAMPLE_FILE_EXTENSIONS = (".yaml", ".yml")
 
-    example_files = os.listdir(EXAMPLE_FILES_DIR)
+SEPARATOR = "\n" + "=" * 80 + "\n"
 
-    for example_file in example_files:
-        example_file_path = os.path.join(EXAMPLE_FILES_DIR, example_file)
+# Set ARAZZO_CACHE=1 to reuse validated demo specifications across runs
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "arazzo")
 
-        # Test against example from arazzo themselves
-        try:
-            print(f"--- Arazzo Example Validation ({example_file}) ---")
-            arazzo_example = load_and_validate_arazzo_yaml(example_file_path)
-            print(f"Arazzo Example Validation ({example_file}) Successful!")
-        except Exception as ex:
-            print(f"Arazzo Example Validation ({example_file}) Failed: {ex}")
-
-        print("\n" + "=" * 80 + "\n")
-
-    # Example Valid Arazzo Specification
-    valid_arazzo_data = {
-        "arazzo": "1.0.0",
-        "info": {
-            "title": "Example Arazzo Document",
-            "version": "1.0.0",
-            "summary": "This is a summary of the document."
-        },
-        "sourceDescriptions": [
-            {
-                "name": "petstore",
-                "url": "https://petstore.swagger.io/v2/swagger.json",
-                "type": "openapi"
-            },
-            {
-                "name": "users",
-                "url": "/local/arazzo/users.json",
-                "type": "arazzo"
-            }
-        ],
-        "workflows": [
-            {
-                "workflowId": "createPetWorkflow",
-                "summary": "Workflow to add a new pet to the store.",
-                "inputs": {
-                    "type": "object",
-                    "properties": {
-                        "name": {"type": "string"},
-                        "tag": {"type": "string"}
-                    },
-                    "required": ["name"]
-                },
-                "steps": [
-                    {
-                        "stepId": "addPet",
-                        "description": "Call to add a pet operation",
-                        "operationId": "addPet",
-                        "parameters": [
-                            {
-                                "name": "petName",
-                                # Note: `in` is not required for a parameter when it's part of `requestBody`
-                                # or if it's a generic value not tied to a specific HTTP location.
-                                # The Arazzo schema for `parameter-object` has `in` as optional for `workflowId` steps.
-                                # For `operationId`/`operationPath` steps, `in` is required on the Parameter object.
-                                # This example is intentionally simplified.
-                                "value": "$.inputs.name"
-                            }
-                        ],
-                        "successCriteria": [
-                            {"condition": "$.response.statusCode == 200"}
-                        ],
-                        "onSuccess": [
-                            {"name": "logSuccess", "type": "end"}
-                        ]
-                    },
-                    {
-                        "stepId": "getPetById",
-                        "description": "Call to get pet operation",
-                        "operationPath": "petstore#/paths/~1pet~1{petId}/get",
-                        "parameters": [
-                            {
-                                "name": "petId",
-                                "in": "path",
-                                # This 'in' is now correctly mapped and required by validator for operation types
-                                "value": "$.steps.addPet.outputs.id"  # Example of dynamic value
-                            }
-                        ],
-                        "successCriteria": [
-                            {"context": "$.response.body", "condition": "name == 'Buddy'",
-                             "type": {"type": "jsonpath", "version": "draft-goessner-dispatch-jsonpath-00"}}
-                            # Corrected type format
-                        ]
-                    }
-                ],
-                "outputs": {
-                    "petId": "$.steps.addPet.outputs.id"
-                }
-            },
-            {
-                "workflowId": "userProfileFlow",
-                "summary": "Workflow to fetch a user profile.",
-                "steps": [
-                    {
-                        "stepId": "getUser",
-                        "workflowId": "getUserDetailsWorkflow"  # Referencing another Arazzo workflow
-                    },
-                    {
-                        "stepId": "updateUser",
-                        "workflowId": "updateUserDetailsWorkflow",
-                        "parameters": [
-                            {"name": "userId", "value": "123"},
-                            {"reference": "#/components/parameters/emailParam", "value": "new@example.com"}
-                        ]
-                    }
-                ]
-            }
-        ],
-        "components": {
-            "parameters": {
-                "emailParam": {
-                    "name": "email",
-                    "in": "query",
-                    "value": "default@example.com"
+# When True, the hard-coded valid example is trusted and built with `model_construct` instead of being validated
+TRUSTED = False
+
+# When True and msgspec is installed, the valid example is decoded with the msgspec mirrors, which only check structure
+FAST = False
+
+# Example Valid Arazzo Specification, kept as raw JSON so it can be validated without building a Python dict
+with open(os.path.join(EXAMPLE_FILES_DIR, "_valid_arazzo.json"), "rb") as _valid_arazzo_file:
+    _VALID_ARAZZO_BYTES = _valid_arazzo_file.read()
+
+
+# Every invalid demo shares the same document header and only varies the part under test
+_INVALID_BASE = {
+    "arazzo": "1.0.0",
+    "info": {"title": "Invalid Arazzo Doc", "version": "1.0.0"},
+    "sourceDescriptions": [
+        {"name": "api", "url": "http://api.example.com"}
+    ],
+    "workflows": [
+        {"workflowId": "simple", "steps": [{"stepId": "s1", "operationId": "op1"}]}
+    ]
+}
+
+# --- Example Invalid Arazzo Specification (missing required field) ---
+_INVALID_DATA_MISSING_INFO_VERSION = {
+    **_INVALID_BASE,
+    "info": {"title": "Invalid Arazzo Doc"}  # Missing required version
+}
+
+# --- Example Invalid Step (missing operation/workflow target) ---
+_INVALID_STEP_DATA = {
+    **_INVALID_BASE,
+    "workflows": [
+        {
+            "workflowId": "broken_step",
+            "steps": [
+                {
+                    "stepId": "s1",
+                    # Missing operationId, operationPath, or workflowId
                 }
-            },
-            "successActions": {
-                "logSuccess": {
-                    "name": "logSuccess",
-                    "type": "end"
+            ]
+        }
+    ]
+}
+
+# --- Example Invalid Step (operation-based parameter missing 'in') ---
+_INVALID_STEP_PARAM_DATA = {
+    **_INVALID_BASE,
+    "workflows": [
+        {
+            "workflowId": "broken_param_step",
+            "steps": [
+                {
+                    "stepId": "s1",
+                    "operationId": "getSomething",
+                    "parameters": [
+                        {"name": "myParam", "value": "abc"}  # Missing 'in' field for operation-based step
+                    ]
                 }
-            }
-        },
-        "x-custom-extension": "some-value"
-    }
+            ]
+        }
+    ]
+}
+
+# --- Example Invalid Data (Duplicate WorkflowId) ---
+_INVALID_DUPLICATE_WORKFLOW_ID = {
+    **_INVALID_BASE,
+    "workflows": [
+        {"workflowId": "workflow1", "steps": [{"stepId": "s1", "operationId": "op1"}]},
+        {"workflowId": "workflow1", "steps": [{"stepId": "s2", "operationId": "op2"}]}
+    ]
+}
+
+# --- Example Invalid Data (Duplicate StepId within a workflow) ---
+_INVALID_DUPLICATE_STEP_ID = {
+    **_INVALID_BASE,
+    "workflows": [
+        {
+            "workflowId": "workflow_with_dup_steps",
+            "steps": [
+                {"stepId": "stepA", "operationId": "opA"},
+                {"stepId": "stepA", "operationId": "opB"}  # Duplicate stepId
+            ]
+        }
+    ]
+}
+
+INVALID_CASES = [
+    ("Missing Info Version", _INVALID_DATA_MISSING_INFO_VERSION, "version"),
+    ("Invalid Step", _INVALID_STEP_DATA, "step_missing_target_type"),
+    ("Operation Param Missing 'in'", _INVALID_STEP_PARAM_DATA, "parameter_in_required_for_operation"),
+    ("Duplicate WorkflowId", _INVALID_DUPLICATE_WORKFLOW_ID, "unique 'workflowId's"),
+    ("Duplicate StepId within Workflow", _INVALID_DUPLICATE_STEP_ID, "unique 'stepId's"),
+]
+
+
+def _validate_json_with_disk_cache(data: bytes) -> ArazzoSpecification:
+    """
+    Validates raw JSON, reusing the pickled result of a previous run when ARAZZO_CACHE=1 is set.
+    Entries are keyed by the document, the model source and the pydantic/pydantic-core versions, so upgrading
+    either or editing the models invalidates them; an entry that cannot be unpickled is treated as a miss.
+    """
+    if os.environ.get("ARAZZO_CACHE") != "1":
+        return validate_arazzo_json(data)
+
+    digest = hashlib.blake2b(data)
+    with open(models.arazzo.__file__, "rb") as f:
+        digest.update(f.read())
+    digest.update(f"{pydantic.VERSION}/{pydantic_core.__version__}".encode())
+    cache_path = os.path.join(CACHE_DIR, f"{digest.hexdigest()}.pkl")
 
-    print("--- Valid Arazzo Data Validation ---")
-    try:
-        arazzo_spec = validate_arazzo_data(valid_arazzo_data)
-        print("Validation successful!")
-        print(f"Arazzo Version: {arazzo_spec.arazzo}")
-        print(f"Info Title: {arazzo_spec.info.title}")
-        print(f"Number of Source Descriptions: {len(arazzo_spec.source_descriptions)}")
-        print(f"Number of Workflows: {len(arazzo_spec.workflows)}")
-        print(f"First Workflow ID: {arazzo_spec.workflows[0].workflow_id}")
-        print(f"First Step ID in first workflow: {arazzo_spec.workflows[0].steps[0].step_id}")
-        if arazzo_spec.components and arazzo_spec.components.parameters:
-            print(f"Component Parameter: {arazzo_spec.components.parameters['emailParam'].name}")
-        if arazzo_spec.model_extra:
-            print(
-                f"X-Extension: {arazzo_spec.model_extra.get('x_custom_extension')}")
-        print("\n" + "=" * 80 + "\n")
-    except ValidationError as e:
-        print("Validation failed for valid data (this should not happen):")
-        print(e)
-    except Exception as e:
-        print(f"An unexpected error occurred: {e}")
-
-    # --- Example Invalid Arazzo Specification (missing required field) ---
-    invalid_data_missing_info_version = {
-        "arazzo": "1.0.0",
-        "info": {
-            "title": "Invalid Arazzo Doc",
-            # "version": "1.0.0" # Missing required version
-        },
-        "sourceDescriptions": [
-            {"name": "api", "url": "http://api.example.com"}
-        ],
-        "workflows": [
-            {"workflowId": "simple", "steps": [{"stepId": "s1", "operationId": "op1"}]}
-        ]
-    }
-
-    print("--- Invalid Arazzo Data Validation (Missing Info Version) ---")
     try:
-        _ = validate_arazzo_data(invalid_data_missing_info_version)
-        print("Validation unexpectedly successful for invalid data.")
-    except ValidationError as e:
-        print("Validation failed as expected for invalid data (missing info.version):")
-        print(e.errors())
-        print("\n" + "=" * 80 + "\n")
-    except Exception as e:
-        print(f"An unexpected error occurred: {e}")
-
-    # --- Example Invalid Step (missing operation/workflow target) ---
-    invalid_step_data = {
-        "arazzo": "1.0.0",
-        "info": {"title": "Invalid Step Test", "version": "1.0.0"},
-        "sourceDescriptions": [
-            {"name": "api", "url": "http://api.example.com"}
-        ],
-        "workflows": [
-            {
-                "workflowId": "broken_step",
-                "steps": [
-                    {
-                        "stepId": "s1",
-                        # Missing operationId, operationPath, or workflowId
-                    }
-                ]
-            }
-        ]
-    }
-    print("--- Invalid Arazzo Data Validation (Invalid Step) ---")
+        with open(cache_path, "rb") as f:
+            return pickle.load(f)
+    except Exception:
+        # Missing, corrupt or written by another pydantic version (ImportError, TypeError, ...): rebuild it
+        pass
+
+    arazzo_spec = validate_arazzo_json(data)
+    # Storing the entry is best-effort: an unwritable cache must not turn a successful validation into a failure
+    temp_path = f"{cache_path}.{os.getpid()}.tmp"
     try:
-        _ = validate_arazzo_data(invalid_step_data)
-        print("Validation unexpectedly successful for invalid step.")
-    except ValidationError as e:
-        print("Validation failed as expected for invalid step:")
-        print(e.errors())
-        print("\n" + "=" * 80 + "\n")
-    except Exception as e:
-        print(f"An unexpected error occurred: {e}")
-
-    # --- Example Invalid Step (operation-based parameter missing 'in') ---
-    invalid_step_param_data = {
-        "arazzo": "1.0.0",
-        "info": {"title": "Invalid Step Param Test", "version": "1.0.0"},
-        "sourceDescriptions": [
-            {"name": "api", "url": "http://api.example.com"}
-        ],
-        "workflows": [
-            {
-                "workflowId": "broken_param_step",
-                "steps": [
-                    {
-                        "stepId": "s1",
-                        "operationId": "getSomething",
-                        "parameters": [
-                            {"name": "myParam", "value": "abc"}  # Missing 'in' field for operation-based step
-                        ]
-                    }
-                ]
-            }
-        ]
-    }
-    print("--- Invalid Arazzo Data Validation (Operation Param Missing 'in') ---")
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        # Write then rename so a concurrent run never reads a partially written entry
+        with open(temp_path, "wb") as f:
+            pickle.dump(arazzo_spec, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, cache_path)
+    except (OSError, pickle.PicklingError) as ex:
+        log.debug(f"Could not write the validation cache entry: {ex}")
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+    return arazzo_spec
+
+
+def _write_lines(lines: List[str], level: int = logging.INFO) -> None:
+    """
+    Logs a block of report lines as a single record.
+    """
+    log.log(level, "\n".join(lines))
+
+
+def _read_example_file(example_file_path: str) -> Union[bytes, OSError]:
+    """
+    Reads one example file, returning the OSError in place of its contents if it cannot be read.
+    """
     try:
-        _ = validate_arazzo_data(invalid_step_param_data)
-        print("Validation unexpectedly successful for invalid step parameter.")
-    except ValidationError as e:
-        print("Validation failed as expected for invalid step parameter:")
-        print(e.errors())
-        print("\n" + "=" * 80 + "\n")
-    except Exception as e:
-        print(f"An unexpected error occurred: {e}")
-
-    # --- Example Invalid Data (Duplicate WorkflowId) ---
-    invalid_duplicate_workflow_id = {
-        "arazzo": "1.0.0",
-        "info": {"title": "Duplicate Workflow Test", "version": "1.0.0"},
-        "sourceDescriptions": [{"name": "api", "url": "http://api.example.com"}],
-        "workflows": [
-            {"workflowId": "workflow1", "steps": [{"stepId": "s1", "operationId": "op1"}]},
-            {"workflowId": "workflow1", "steps": [{"stepId": "s2", "operationId": "op2"}]}
-        ]
-    }
-    print("--- Invalid Arazzo Data Validation (Duplicate WorkflowId) ---")
+        return Path(example_file_path).read_bytes()
+    except OSError as ex:
+        return ex
+
+
+def _format_errors(errors: List[ErrorDetails]) -> str:
+    """
+    Renders validation errors one per line as "<loc>: <msg> [type=<type>]", without echoing the (possibly large) input.
+    """
+    lines = [f"{len(errors)} validation error{'s' if len(errors) != 1 else ''} for ArazzoSpecification"]
+    for error in errors:
+        loc = ".".join(map(str, error["loc"]))
+        lines.append(f"  {loc + ': ' if loc else ''}{error['msg']} [type={error['type']}]")
+    return "\n".join(lines)
+
+
+def _validate_one(example_document: Union[bytes, BaseException]) -> Tuple[bool, str]:
+    """
+    Parses and validates a single example document. Runs inside a worker process.
+
+    Returns:
+        (True, "") on success, otherwise (False, <error message>).
+    """
+    if isinstance(example_document, BaseException):
+        return False, str(example_document)
+
     try:
-        _ = validate_arazzo_data(invalid_duplicate_workflow_id)
-        print("Validation unexpectedly successful for duplicate workflow ID.")
-    except ValidationError as e:
-        print("Validation failed as expected for duplicate workflow ID:")
-        print(e.errors())
-        print("\n" + "=" * 80 + "\n")
-    except Exception as e:
-        print(f"An unexpected error occurred: {e}")
-
-    # --- Example Invalid Data (Duplicate StepId within a workflow) ---
-    invalid_duplicate_step_id = {
-        "arazzo": "1.0.0",
-        "info": {"title": "Duplicate Step Test", "version": "1.0.0"},
-        "sourceDescriptions": [{"name": "api", "url": "http://api.example.com"}],
-        "workflows": [
-            {
-                "workflowId": "workflow_with_dup_steps",
-                "steps": [
-                    {"stepId": "stepA", "operationId": "opA"},
-                    {"stepId": "stepA", "operationId": "opB"}  # Duplicate stepId
-                ]
-            }
-        ]
-    }
-    print("--- Invalid Arazzo Data Validation (Duplicate StepId within Workflow) ---")
+        data = load_arazzo_yaml(example_document)
+        _, errors = validate_arazzo_data_safe(data)
+    except Exception as ex:
+        # Contain any failure to this file; an exception escaping the worker would abort the whole run
+        return False, str(ex)
+
+    if errors:
+        return False, _format_errors(errors)
+    return True, ""
+
+
+def _report_examples(example_files: List[str], example_results: Iterable[Tuple[bool, str]]) -> None:
+    """
+    Reports the outcome of each example file, in the same order as `example_files`.
+    """
+    for example_file, (ok, message) in zip(example_files, example_results):
+        # Test against example from arazzo themselves
+        lines = [f"--- Arazzo Example Validation ({example_file}) ---"]
+        if ok:
+            lines.append(f"Arazzo Example Validation ({example_file}) Successful!")
+        else:
+            lines.append(f"Arazzo Example Validation ({example_file}) Failed: {message}")
+        lines.append(SEPARATOR)
+        _write_lines(lines, logging.INFO if ok else logging.ERROR)
+
+
+def _run_expect_fail(title: str, data: Dict[str, Any], expected_error: str) -> None:
+    """
+    Validates `data`, which is expected to fail with an error mentioning `expected_error`, and reports the outcome.
+    """
+    lines = [f"--- Invalid Arazzo Data Validation ({title}) ---"]
+    _, errors = validate_arazzo_data_safe(data)
+    if not errors:
+        lines.append(f"Validation unexpectedly successful for invalid data ({title}).")
+        _write_lines(lines, logging.ERROR)
+        return
+
+    if any(expected_error in str(error) for error in errors):
+        level = logging.INFO
+        lines.append(f"Validation failed as expected for invalid data ({title}):")
+    else:
+        level = logging.WARNING
+        lines.append(f"Validation failed for invalid data ({title}), but not with the expected '{expected_error}' error:")
+    lines.append(_format_errors(errors))
+    lines.append(SEPARATOR)
+    _write_lines(lines, level)
+
+
+def _parse_args(argv: Optional[List[str]]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Validates the example Arazzo documents and runs the in-memory demos.")
+    verbosity = parser.add_mutually_exclusive_group()
+    verbosity.add_argument("--quiet", action="store_true",
+                           help="Only report unexpected results, e.g. for throughput benchmarks and batch runs")
+    verbosity.add_argument("--debug", action="store_true",
+                           help="Also report details of the validated specification")
+    return parser.parse_args(argv)
+
+
+def run(argv: Optional[List[str]] = None) -> None:
+    """
+    Validates every example file, then runs the valid and invalid in-memory demos.
+
+    Args:
+        argv: Command line arguments, defaults to sys.argv[1:].
+    """
+    args = _parse_args(argv)
+    level = logging.WARNING if args.quiet else logging.DEBUG if args.debug else logging.INFO
+    _LOG_HANDLER.setStream(sys.stdout)
+    if _LOG_HANDLER not in log.handlers:
+        log.addHandler(_LOG_HANDLER)
+    log.setLevel(level)
+    log.propagate = False
+
+    with os.scandir(EXAMPLE_FILES_DIR) as entries:
+        example_entries = sorted(
+            (entry for entry in entries if entry.is_file() and entry.name.endswith(EXAMPLE_FILE_EXTENSIONS)),
+            key=lambda entry: entry.name
+        )
+    example_files = [entry.name for entry in example_entries]
+    example_file_paths = [entry.path for entry in example_entries]
+
+    # Read on worker threads so disk latency overlaps; a thread pool needs no event loop, so run() can be called
+    # from a host that already has one running
+    with ThreadPoolExecutor() as executor:
+        example_documents = list(executor.map(_read_example_file, example_file_paths))
+
+    # Each example is parsed and validated independently, so spread them across processes
+    with ProcessPoolExecutor() as executor:
+        _report_examples(example_files, executor.map(_validate_one, example_documents))
+
+    lines = ["--- Valid Arazzo Data Validation ---"]
+    level = logging.ERROR
     try:
-        _ = validate_arazzo_data(invalid_duplicate_step_id)
-        print("Validation unexpectedly successful for duplicate step ID.")
+        if TRUSTED:
+            arazzo_spec = construct_model(ArazzoSpecification, json.loads(_VALID_ARAZZO_BYTES))
+            outcome = "Constructed without validation (TRUSTED)."
+        elif FAST and decode_arazzo_json is not None:
+            arazzo_spec = decode_arazzo_json(_VALID_ARAZZO_BYTES)
+            outcome = "Structurally decoded with msgspec (FAST); the Arazzo validation rules were not checked."
+        else:
+            arazzo_spec = _validate_json_with_disk_cache(_VALID_ARAZZO_BYTES)
+            outcome = "Validation successful!"
+        level = logging.INFO
+        lines.append(outcome)
+        if log.isEnabledFor(logging.DEBUG):
+            lines.append(f"Arazzo Version: {arazzo_spec.arazzo}")
+            lines.append(f"Info Title: {arazzo_spec.info.title}")
+            lines.append(f"Number of Source Descriptions: {len(arazzo_spec.source_descriptions)}")
+            lines.append(f"Number of Workflows: {len(arazzo_spec.workflows)}")
+            lines.append(f"First Workflow ID: {arazzo_spec.workflows[0].workflow_id}")
+            lines.append(f"First Step ID in first workflow: {arazzo_spec.workflows[0].steps[0].step_id}")
+            if arazzo_spec.components and arazzo_spec.components.parameters:
+                lines.append(f"Component Parameter: {arazzo_spec.components.parameters['emailParam'].name}")
+            # The msgspec mirrors do not keep extensions
+            extensions = getattr(arazzo_spec, "extensions", None)
+            if extensions:
+                lines.append(f"X-Extension: {extensions.get('x-custom-extension')}")
+        lines.append(SEPARATOR)
     except ValidationError as e:
-        print("Validation failed as expected for duplicate step ID:")
-        print(e.errors())
-        print("\n" + "=" * 80 + "\n")
+        lines.append("Validation failed for valid data (this should not happen):")
+        lines.append(str(e))
     except Exception as e:
-        print(f"An unexpected error occurred: {e}")
+        lines.append(f"An unexpected error occurred: {e}")
+    _write_lines(lines, level)
+
+    for title, data, expected_error in INVALID_CASES:
+        _run_expect_fail(title, data, expected_error)
+
+
+if __name__ == "__main__":
+    run()
@@ -1,17 +1,23 @@
 import json
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Type, Union, get_args, get_origin
 import re
 from pathlib import Path
 import yaml
 from pydantic.alias_generators import to_camel
-from pydantic_core import PydanticCustomError
+from pydantic_core import ErrorDetails, PydanticCustomError
 from pydantic import (
     BaseModel, Field, ValidationError,
-    model_validator, field_validator,
-    RootModel, ConfigDict
+    model_validator, field_validator, model_serializer,
+    RootModel, ConfigDict, TypeAdapter, SerializerFunctionWrapHandler
 )
 
+try:
+    # libyaml-backed parser; considerably faster than the pure-Python one
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 class SpecificationExtensionsMixin(BaseModel):
     """
     This allows "x-" prefixed properties as per the Arazzo spec.
@@ -56,6 +62,28 @@ def validate_unique_items(v: List[Any], field_name: str) -> List[Any]:
 
     return v
 
+def split_extensions(data: Any) -> Any:
+    """
+    Moves the "x-" prefixed keys of a mapping into its "extensions" key, merging them over an "extensions" mapping
+    that is already present. A non-mapping "extensions" value is left untouched for field validation to reject.
+    Returns a new dictionary if anything was moved, otherwise `data` unchanged.
+    """
+    if not isinstance(data, Mapping):
+        return data
+
+    supplied = data.get('extensions', {})
+    if not isinstance(supplied, Mapping):
+        return data
+
+    extensions = {key: value for key, value in data.items() if isinstance(key, str) and key.startswith('x-')}
+    if not extensions:
+        return data
+
+    data = {key: value for key, value in data.items() if key not in extensions}
+    data['extensions'] = {**supplied, **extensions}
+    return data
+
+
 class Info(SpecificationExtensionsMixin):
     """
     Provides metadata about the Arazzo description.
@@ -572,6 +600,9 @@ class ArazzoSpecification(SpecificationExtensionsMixin):
     The root document for an Arazzo workflow specification.
     Corresponds to the root schema.
     """
+    # "x-" extensions are collected into `extensions` instead of `model_extra`, so anything else unknown is dropped
+    model_config = ConfigDict(extra='ignore')
+
     arazzo: str = Field(..., description="The version number of the Arazzo Specification", pattern=r"^1\.0\.\d+(-.+)?$")
     info: Info = Field(..., description="Metadata about the Arazzo description")
     source_descriptions: List[SourceDescription] = Field(
@@ -621,6 +652,36 @@ class ArazzoSpecification(SpecificationExtensionsMixin):
 
     components: Optional[Components] = Field(None,
                                              description="Holds a set of reusable objects for different aspects of the Arazzo Specification")
+    extensions: Dict[str, Any] = Field(default_factory=dict,
+                                       description="The \"x-\" prefixed specification extensions of the document")
+
+    @model_validator(mode='before')
+    @classmethod
+    def collect_extensions(cls, data: Any) -> Any:
+        return split_extensions(data)
+
+    @field_validator('extensions')
+    @classmethod
+    def validate_extension_keys(cls, v: Dict[str, Any]) -> Dict[str, Any]:
+        invalid_keys = [key for key in v if not key.startswith('x-')]
+        if invalid_keys:
+            raise PydanticCustomError(
+                'invalid_extension_key',
+                'Specification extension keys must start with "x-". Found: {invalid_keys}.',
+                {'invalid_keys': ", ".join(invalid_keys)}
+            )
+        return v
+
+    @model_serializer(mode='wrap')
+    def inline_extensions(self, handler: SerializerFunctionWrapHandler) -> Dict[str, Any]:
+        # Dump the "x-" extensions back at the root, as they appear in an Arazzo document
+        data = handler(self)
+        data.update(data.pop('extensions', None) or {})
+        return data
+
+
+# Built once at import so every validation call reuses the same compiled core schema.
+_ADAPTER = TypeAdapter(ArazzoSpecification)
 
 
 def validate_arazzo_data(data: Dict[str, Any]) -> ArazzoSpecification:
@@ -636,12 +697,129 @@ def validate_arazzo_data(data: Dict[str, Any]) -> ArazzoSpecification:
     Raises:
         ValidationError: If the data does not conform to the schema.
     """
-    return ArazzoSpecification.model_validate(data)
+    return _ADAPTER.validate_python(data)
+
+
+def validate_arazzo_data_safe(data: Dict[str, Any]) -> Tuple[Optional[ArazzoSpecification], List[ErrorDetails]]:
+    """
+    Validates a dictionary against the ArazzoSpecification model without raising on invalid data.
+
+    Args:
+        data: The dictionary representing the Arazzo specification.
+
+    Returns:
+        (ArazzoSpecification, []) if validation is successful, otherwise (None, <list of error details>).
+    """
+    try:
+        return _ADAPTER.validate_python(data), []
+    except ValidationError as e:
+        return None, e.errors()
+
+
+def validate_arazzo_json(data: Union[str, bytes]) -> ArazzoSpecification:
+    """
+    Validates raw JSON text against the ArazzoSpecification model.
+    Parsing happens inside pydantic-core, so no intermediate Python dict is built.
+
+    Args:
+        data: A string or bytes containing the JSON document.
+
+    Returns:
+        An instance of ArazzoSpecification if validation is successful.
+
+    Raises:
+        ValidationError: If the data is not valid JSON or does not conform to the schema.
+    """
+    return _ADAPTER.validate_json(data)
+
+
+def _construct_value(annotation: Any, value: Any) -> Any:
+    """
+    Builds `value` according to the field `annotation`, constructing any nested models without validation.
+    """
+    if value is None:
+        return None
+
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return construct_model(annotation, value)
+
+    if isinstance(annotation, type) and issubclass(annotation, Enum):
+        try:
+            return annotation(value)
+        except ValueError:
+            return value
+
+    origin = get_origin(annotation)
+    args = [arg for arg in get_args(annotation) if arg is not type(None)]
+
+    if origin is Union:
+        if len(args) == 1:
+            return _construct_value(args[0], value)
+        if isinstance(value, dict):
+            # Pick the first model whose required fields are all present in the data
+            for candidate in args:
+                if isinstance(candidate, type) and issubclass(candidate, BaseModel) and all(
+                        (field.alias or name) in value or name in value
+                        for name, field in candidate.model_fields.items() if field.is_required()
+                ):
+                    return construct_model(candidate, value)
+        else:
+            for candidate in args:
+                if isinstance(candidate, type) and issubclass(candidate, Enum):
+                    return _construct_value(candidate, value)
+        return value
+
+    if origin is list and isinstance(value, list):
+        return [_construct_value(args[0], item) for item in value]
+
+    if origin is dict and isinstance(value, dict):
+        return {key: _construct_value(args[1], item) for key, item in value.items()}
+
+    return value
+
+
+def construct_model(model: Type[BaseModel], data: Any) -> Any:
+    """
+    Recursively builds `model` and its nested models from trusted data using `model_construct`.
+    No validation is performed, so this must only be used for data already known to be valid.
+
+    Args:
+        model: The model class to build, e.g. ArazzoSpecification.
+        data: The dictionary representing the model, keyed by alias or field name.
+
+    Returns:
+        An instance of `model`, or `data` unchanged if it is not a dictionary.
+    """
+    if not isinstance(data, dict):
+        return data
+
+    if issubclass(model, RootModel):
+        return model.model_construct(_construct_value(model.model_fields['root'].annotation, data))
+
+    if 'extensions' in model.model_fields:
+        data = split_extensions(data)
+
+    fields_by_key = {}
+    for name, field in model.model_fields.items():
+        fields_by_key[name] = (name, field)
+        if field.alias:
+            fields_by_key[field.alias] = (name, field)
+
+    values = {}
+    for key, value in data.items():
+        if key in fields_by_key:
+            name, field = fields_by_key[key]
+            values[name] = _construct_value(field.annotation, value)
+        else:
+            values[key] = value
+
+    return model.model_construct(**values)
 
 
 def load_and_validate_arazzo_json(json_string_or_filepath: str) -> ArazzoSpecification:
     """
     Loads and validates an Arazzo specification from a JSON string or file.
+    The raw JSON is handed straight to pydantic-core, which parses and validates it in one pass.
 
     Args:
         json_string_or_filepath: A string containing JSON data or a path to a JSON file.
@@ -656,11 +834,18 @@ def load_and_validate_arazzo_json(json_string_or_filepath: str) -> ArazzoSpecifi
     """
     try:
         if Path(json_string_or_filepath).is_file() and Path(json_string_or_filepath).suffix.lower() == '.json':
-            with open(json_string_or_filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(json_string_or_filepath, 'rb') as f:
+                data = f.read()
         else:
-            data = json.loads(json_string_or_filepath)
-        return validate_arazzo_data(data)
+            data = json_string_or_filepath
+
+        try:
+            return validate_arazzo_json(data)
+        except ValidationError as e:
+            if not any(error['type'] == 'json_invalid' for error in e.errors()):
+                raise
+            # Malformed JSON: re-parse with the json module so callers get the same JSONDecodeError as always
+            return validate_arazzo_data(json.loads(data))
     except (json.JSONDecodeError, FileNotFoundError) as e:
         print(f"Error loading JSON: {e}")
         raise
@@ -669,6 +854,30 @@ def load_and_validate_arazzo_json(json_string_or_filepath: str) -> ArazzoSpecifi
         raise
 
 
+def load_arazzo_yaml(yaml_string_or_filepath: Union[str, bytes]) -> Any:
+    """
+    Loads an Arazzo specification from a YAML string or file without validating it.
+
+    Args:
+        yaml_string_or_filepath: A string containing YAML data or a path to a YAML file.
+            Raw YAML bytes (e.g. a file that was already read) are parsed as-is.
+
+    Returns:
+        The parsed YAML document.
+
+    Raises:
+        yaml.YAMLError: If the string is not valid YAML.
+        FileNotFoundError: If the filepath does not exist.
+    """
+    if isinstance(yaml_string_or_filepath, bytes):
+        return yaml.load(yaml_string_or_filepath, Loader=_YamlLoader)
+    if Path(yaml_string_or_filepath).is_file() and Path(yaml_string_or_filepath).suffix.lower() in ['.yaml',
+                                                                                                    '.yml']:
+        with open(yaml_string_or_filepath, 'r', encoding='utf-8') as f:
+            return yaml.load(f, Loader=_YamlLoader)
+    return yaml.load(yaml_string_or_filepath, Loader=_YamlLoader)
+
+
 def load_and_validate_arazzo_yaml(yaml_string_or_filepath: str) -> ArazzoSpecification:
     """
     Loads and validates an Arazzo specification from a YAML string or file.
@@ -687,13 +896,7 @@ def load_and_validate_arazzo_yaml(yaml_string_or_filepath: str) -> ArazzoSpecifi
     """
 
     try:
-        if Path(yaml_string_or_filepath).is_file() and Path(yaml_string_or_filepath).suffix.lower() in ['.yaml',
-                                                                                                        '.yml']:
-            with open(yaml_string_or_filepath, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
-        else:
-            data = yaml.safe_load(yaml_string_or_filepath)
-
+        data = load_arazzo_yaml(yaml_string_or_filepath)
         return validate_arazzo_data(data)
     except (yaml.YAMLError, FileNotFoundError) as e:
         print(f"Error loading YAML: {e}")
@@ -701,3 +904,15 @@ def load_and_validate_arazzo_yaml(yaml_string_or_filepath: str) -> ArazzoSpecifi
     except ValidationError as e:
         print(f"Validation error for YAML data: {e}")
         raise
+
+
+# Validate a minimal document once at import so the first real validation does not pay the warm-up cost
+try:
+    _ADAPTER.validate_python({
+        "arazzo": "1.0.0",
+        "info": {"title": "_", "version": "0"},
+        "sourceDescriptions": [{"name": "_", "url": "_"}],
+        "workflows": [{"workflowId": "_", "steps": [{"stepId": "_", "operationId": "_"}]}]
+    })
+except ValidationError:
+    pass
@@ -0,0 +1,218 @@
+"""
+msgspec mirrors of the Arazzo models in models.arazzo, for decoding trusted documents quickly.
+
+msgspec parses and type-checks JSON in a single C pass, but only enforces the structural rules (types, required
+fields, patterns, lengths). The cross-field rules implemented as validators on the Pydantic models (step targets,
+unique ids, criterion context, action targets, ...) are NOT checked here, so use models.arazzo whenever a document
+is untrusted or detailed errors are needed.
+
+Unions of several objects (e.g. Parameter or ReusableObject) cannot be decoded by msgspec without a tag field,
+so those are mirrored by a single struct carrying the fields of both alternatives.
+"""
+from typing import Annotated, Any, Dict, List, Literal, Optional, Union
+
+import msgspec
+
+
+class _ArazzoStruct(msgspec.Struct, rename="camel"):
+    """
+    Base for all mirrors: camelCase keys like the Pydantic aliases, unknown ("x-") keys are ignored.
+    """
+
+
+class InfoMS(_ArazzoStruct, kw_only=True):
+    """
+    Mirrors models.arazzo.Info
+    """
+    title: str
+    summary: Optional[str] = None
+    description: Optional[str] = None
+    version: str
+
+
+class SourceDescriptionMS(_ArazzoStruct, kw_only=True):
+    """
+    Mirrors models.arazzo.SourceDescription
+    """
+    name: Annotated[str, msgspec.Meta(pattern=r"^[A-Za-z0-9_\\-]+$")]
+    url: str
+    type: Optional[Literal["arazzo", "openapi"]] = None
+
+
+class ParameterOrReusableObjectMS(_ArazzoStruct, kw_only=True):
+    """
+    Mirrors Union[models.arazzo.Parameter, models.arazzo.ReusableObject]
+    """
+    name: Optional[str] = None
+    in_: Optional[Literal["path", "query", "header", "cookie"]] = None
+    reference: Optional[str] = None
+    value: Any = None
+
+
+class ParameterMS(_ArazzoStruct, kw_only=True):
+    """
+    Mirrors models.arazzo.Parameter
+    """
+    name: str
+    in_: Optional[Literal["path", "query", "header", "cookie"]] = None
+    value: Any
+
+
+class PayloadReplacementMS(_ArazzoStruct, kw_only=True):
+    """
+    Mirrors models.arazzo.PayloadReplacement
+    """
+    target: str
+    value: str
+
+
+class RequestBodyMS(_ArazzoStruct, kw_only=True):
+    """
+    Mirrors models.arazzo.RequestBody
+    """
+    content_type: Optional[str] = None
+    payload: Any = None
+    replacements: Optional[List[PayloadReplacementMS]] = None
+
+
+class CriterionExpressionTypeMS(_ArazzoStruct, kw_only=True):
+    """
+    Mirrors models.arazzo.CriterionExpressionType
+    """
+    type: Literal["jsonpath", "xpath"]
+    version: str
+
+
+class CriterionMS(_ArazzoStruct, kw_only=True):
+    """
+    Mirrors models.arazzo.Criterion
+    """
+    context: Optional[str] = None
+    condition: str
+    type: Union[Literal["simple", "regex", "jsonpath", "xpath"], CriterionExpressionTypeMS] = "simple"
+
+
+class SuccessActionMS(_ArazzoStruct, kw_only=True):
+    """
+    Mirrors models.arazzo.SuccessAction
+    """
+    name: str
+    type: Literal["end", "goto"]
+    workflow_id: Optional[str] = None
+    step_id: Optional[str] = None
+    criteria: Optional[Annotated[List[CriterionMS], msgspec.Meta(min_length=1)]] = None
+
+
+class SuccessActionOrReusableObjectMS(_ArazzoStruct, kw_only=True):
+    """
+    Mirrors Union[models.arazzo.SuccessAction, models.arazzo.ReusableObject]
+    """
+    name: Optional[str] = None
+    type: Optional[Literal["end", "goto"]] = None
+    workflow_id: Optional[str] = None
+    step_id: Optional[str] = None
+    criteria: Optional[Annotated[List[CriterionMS], msgspec.Meta(min_length=1)]] = None
+    reference: Optional[str] = None
+    value: Any = None
+
+
+class FailureActionMS(_ArazzoStruct, kw_only=True):
+    """
+    Mirrors models.arazzo.FailureAction
+    """
+    name: str
+    type: Literal["end", "goto", "retry"]
+    workflow_id: Optional[str] = None
+    step_id: Optional[str] = None
+    retry_after: Optional[Annotated[float, msgspec.Meta(ge=0)]] = None
+    retry_limit: Optional[Annotated[int, msgspec.Meta(ge=0)]] = None
+    criteria: Optional[List[CriterionMS]] = None
+
+
+class FailureActionOrReusableObjectMS(_ArazzoStruct, kw_only=True):
+    """
+    Mirrors Union[models.arazzo.FailureAction, models.arazzo.ReusableObject]
+    """
+    name: Optional[str] = None
+    type: Optional[Literal["end", "goto", "retry"]] = None
+    workflow_id: Optional[str] = None
+    step_id: Optional[str] = None
+    retry_after: Optional[Annotated[float, msgspec.Meta(ge=0)]] = None
+    retry_limit: Optional[Annotated[int, msgspec.Meta(ge=0)]] = None
+    criteria: Optional[List[CriterionMS]] = None
+    reference: Optional[str] = None
+    value: Any = None
+
+
+class StepMS(_ArazzoStruct, kw_only=True):
+    """
+    Mirrors models.arazzo.Step
+    """
+    step_id: str
+    description: Optional[str] = None
+    operation_id: Optional[str] = None
+    operation_path: Optional[str] = None
+    workflow_id: Optional[str] = None
+    parameters: Optional[List[ParameterOrReusableObjectMS]] = None
+    request_body: Optional[RequestBodyMS] = None
+    success_criteria: Optional[Annotated[List[CriterionMS], msgspec.Meta(min_length=1)]] = None
+    on_success: Optional[List[SuccessActionOrReusableObjectMS]] = None
+    on_failure: Optional[List[FailureActionOrReusableObjectMS]] = None
+    outputs: Optional[Dict[str, str]] = None
+
+
+class WorkflowMS(_ArazzoStruct, kw_only=True):
+    """
+    Mirrors models.arazzo.Workflow
+    """
+    workflow_id: str
+    summary: Optional[str] = None
+    description: Optional[str] = None
+    inputs: Optional[Dict[str, Any]] = None
+    depends_on: Optional[List[str]] = None
+    steps: Annotated[List[StepMS], msgspec.Meta(min_length=1)]
+    success_actions: Optional[List[SuccessActionOrReusableObjectMS]] = None
+    failure_actions: Optional[List[FailureActionOrReusableObjectMS]] = None
+    outputs: Optional[Dict[str, str]] = None
+    parameters: Optional[List[ParameterOrReusableObjectMS]] = None
+
+
+class ComponentsMS(_ArazzoStruct, kw_only=True):
+    """
+    Mirrors models.arazzo.Components
+    """
+    inputs: Optional[Dict[str, Dict[str, Any]]] = None
+    parameters: Optional[Dict[str, ParameterMS]] = None
+    success_actions: Optional[Dict[str, SuccessActionMS]] = None
+    failure_actions: Optional[Dict[str, FailureActionMS]] = None
+
+
+class ArazzoSpecificationMS(_ArazzoStruct, kw_only=True):
+    """
+    Mirrors models.arazzo.ArazzoSpecification
+    """
+    arazzo: Annotated[str, msgspec.Meta(pattern=r"^1\.0\.\d+(-.+)?$")]
+    info: InfoMS
+    source_descriptions: Annotated[List[SourceDescriptionMS], msgspec.Meta(min_length=1)]
+    workflows: Annotated[List[WorkflowMS], msgspec.Meta(min_length=1)]
+    components: Optional[ComponentsMS] = None
+
+
+_DECODER = msgspec.json.Decoder(ArazzoSpecificationMS)
+
+
+def decode_arazzo_json(data: Union[str, bytes]) -> ArazzoSpecificationMS:
+    """
+    Decodes raw JSON into an ArazzoSpecificationMS, checking structure only.
+
+    Args:
+        data: A string or bytes containing the JSON document.
+
+    Returns:
+        An instance of ArazzoSpecificationMS if decoding is successful.
+
+    Raises:
+        msgspec.ValidationError: If the data does not match the structure of the specification.
+        msgspec.DecodeError: If the data is not valid JSON.
+    """
+    return _DECODER.decode(data)
@@ -0,0 +1,46 @@
+"""
+Runs main.py under PyPy when it is available, otherwise under the current interpreter.
+
+The driver in main.py is mostly pure-Python looping, dict construction and I/O, which PyPy's JIT speeds up.
+PyPy is only used when `pypy3` is on the PATH and can import the dependencies (pydantic-core publishes PyPy
+wheels, but they must be installed for that interpreter), so this behaves exactly like `python main.py` otherwise.
+
+Usage:
+    python run.py
+    pypy3 main.py   # run directly under PyPy
+"""
+import os
+import platform
+import shutil
+import subprocess
+import sys
+from typing import Optional
+
+SCRIPT_DIR = os.path.dirname(os.path.realpath(__file__))
+
+MAIN_PATH = os.path.join(SCRIPT_DIR, "main.py")
+
+
+def _find_pypy() -> Optional[str]:
+    """
+    Returns the path to a usable pypy3 executable, or None if we are already on PyPy or none can be used.
+    """
+    if platform.python_implementation() == "PyPy":
+        return None
+
+    pypy = shutil.which("pypy3")
+    if pypy is None:
+        return None
+
+    probe = subprocess.run([pypy, "-c", "import pydantic, yaml"], capture_output=True)
+    return pypy if probe.returncode == 0 else None
+
+
+if __name__ == "__main__":
+    pypy = _find_pypy()
+    if pypy is not None:
+        os.execv(pypy, [pypy, MAIN_PATH, *sys.argv[1:]])
+
+    # Imported rather than executed so a Cython-compiled `main` extension (see setup.py) is used when built
+    from main import run
+    run()